@@ -0,0 +1,50 @@
+"""Numba render kernels for the hot display path.
+
+Importing this module requires numba; video_comparator guards the import
+and falls back to its OpenCV pipeline when the import fails. Keeping the
+kernels in their own module means numba's cache files are keyed to a
+small, rarely-changing source file instead of the whole application.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def render_view(ref, comp, out_ref, out_comp, out_diff,
+                y0, x0, crop_h, crop_w, compute_diff):
+    """Fused crop + nearest-neighbour scale + diff, one pass.
+
+    ref/comp are full BGR source frames; the visible rect starts at
+    (y0, x0) and spans crop_h x crop_w source pixels, mapped onto the
+    out-sized buffers. When compute_diff is true, the 2-d out_diff
+    receives the Rec.601 luma absdiff from the same source reads, so
+    each source pixel is loaded from DRAM once and each output pixel is
+    written once; the palette is applied by Qt's indexed-color blit.
+    Source coordinates use 16.16 fixed point to keep floats out of the
+    inner loop.
+    """
+    out_h, out_w = out_ref.shape[0], out_ref.shape[1]
+    step_y = (crop_h << 16) // out_h
+    step_x = (crop_w << 16) // out_w
+    for oy in prange(out_h):
+        sy = y0 + ((oy * step_y) >> 16)
+        for ox in range(out_w):
+            sx = x0 + ((ox * step_x) >> 16)
+            b1 = ref[sy, sx, 0]
+            g1 = ref[sy, sx, 1]
+            r1 = ref[sy, sx, 2]
+            b2 = comp[sy, sx, 0]
+            g2 = comp[sy, sx, 1]
+            r2 = comp[sy, sx, 2]
+            out_ref[oy, ox, 0] = b1
+            out_ref[oy, ox, 1] = g1
+            out_ref[oy, ox, 2] = r1
+            out_comp[oy, ox, 0] = b2
+            out_comp[oy, ox, 1] = g2
+            out_comp[oy, ox, 2] = r2
+            if compute_diff:
+                # Same integer luma weights as _diff_kernel / cv2
+                l1 = (114 * int(b1) + 587 * int(g1) + 299 * int(r1)) // 1000
+                l2 = (114 * int(b2) + 587 * int(g2) + 299 * int(r2)) // 1000
+                out_diff[oy, ox] = abs(l1 - l2)
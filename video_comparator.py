@@ -21,8 +21,14 @@ Build executable:
     pyinstaller video_comparator.spec
 """
 
+import collections
 import os.path
 import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from multiprocessing import shared_memory
 from typing import Any
 import os
 import time
@@ -37,12 +43,40 @@ from PyQt6.QtWidgets import (
     QPushButton, QSlider, QLabel, QFileDialog, QMessageBox, QDoubleSpinBox, QSplitter
 )
 
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QTimer, QEvent, QUrl
-from PyQt6.QtGui import QPixmap, QImage, QFont, QIcon, QDragEnterEvent, QDropEvent
+from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QTimer, QEvent, QUrl, QObject, QThread
+from PyQt6.QtGui import QPixmap, QImage, QFont, QIcon, QDragEnterEvent, QDropEvent, qRgb
 from cv2 import Mat
 from numpy import dtype, floating, integer, ndarray
 # from numpy._core.multiarray import _SCT
 
+# Optional: Numba fuses the per-pixel diff/colorize loop into a single
+# parallel pass; without it the NumPy/OpenCV pipeline is used instead.
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Optional: fused crop+scale+diff render kernel (also needs numba)
+try:
+    from kernels import render_view as _render_view
+except ImportError:
+    _render_view = None
+
+# Optional: PyAV decodes with multiple threads and lets libswscale deliver
+# RGB24 directly, skipping the per-frame BGR->RGB pass of cv2.VideoCapture.
+try:
+    import av
+except ImportError:
+    av = None
+
+# Optional: PyTurboJPEG wraps libjpeg-turbo, decoding JPEGs 2-4x faster than
+# OpenCV's bundled libjpeg and releasing the GIL for the whole decode.
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    _turbo_jpeg = TurboJPEG()  # raises OSError when libturbojpeg is absent
+except (ImportError, OSError):
+    _turbo_jpeg = None
+
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
@@ -77,18 +111,360 @@ def setup_logging():
 # VIDEO LOADER & COMPARATOR
 # ============================================================================
 
+def _build_diff_palette() -> np.ndarray:
+    """256-entry BGR palette ramping black -> blue -> red for the diff view.
+
+    Matches the legend in the right-view title: zero difference is black,
+    small differences shade into blue, large ones into red. Applying it is
+    a single cache-resident table gather per pixel.
+    """
+    lut = np.zeros((256, 1, 3), dtype=np.uint8)  # BGR, like the frames
+    lut[:128, 0, 0] = np.linspace(0, 255, 128)    # black -> blue
+    lut[128:, 0, 0] = np.linspace(255, 0, 128)    # blue fades out
+    lut[128:, 0, 2] = np.linspace(0, 255, 128)    # red fades in
+    return lut
+
+
+_DIFF_LUT = _build_diff_palette()
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _diff_kernel(ref, comp, out):
+        """Fused luma -> absdiff, one pass into a single-channel map.
+
+        Colorization happens at display time on the visible crop only, so
+        the per-frame diff carries one byte per pixel instead of three.
+        """
+        h, w = ref.shape[:2]
+        for y in prange(h):
+            for x in range(w):
+                # Rec.601 integer luma on BGR frames, same weights as cv2
+                l1 = (114 * int(ref[y, x, 0]) + 587 * int(ref[y, x, 1])
+                      + 299 * int(ref[y, x, 2])) // 1000
+                l2 = (114 * int(comp[y, x, 0]) + 587 * int(comp[y, x, 1])
+                      + 299 * int(comp[y, x, 2])) // 1000
+                out[y, x] = abs(l1 - l2)
+else:
+    _diff_kernel = None
+
+
+def _warm_kernels():
+    """Compile the optional Numba kernels on tiny inputs.
+
+    The first call on a machine pays the full JIT compile (cache=True only
+    helps later runs), so this must run on a worker thread — never the GUI
+    thread. Subsequent calls hit the compiled dispatch and cost nothing.
+    """
+    dummy = np.zeros((2, 2, 3), dtype=np.uint8)
+    if _diff_kernel is not None:
+        _diff_kernel(dummy, dummy, np.empty((2, 2), dtype=np.uint8))
+    if _render_view is not None:
+        _render_view(dummy, dummy, np.empty_like(dummy), np.empty_like(dummy),
+                     np.empty((2, 2), dtype=np.uint8), 0, 0, 2, 2, True)
+
+
+def _reduced_imread_flag(h: int, w: int):
+    """Pick an IMREAD_REDUCED_COLOR_* flag for sources far above screen size.
+
+    Decoding at 1/2, 1/4 or 1/8 resolution is much faster (native scaled
+    decode for JPEG) and cuts peak RAM; full resolution is kept whenever the
+    source is within 2x of the largest screen dimension. Returns
+    (imread flag, reduction factor).
+    """
+    app = QApplication.instance()
+    screen = app.primaryScreen() if app is not None else None
+    if screen is None:
+        return cv2.IMREAD_COLOR, 1
+    target = max(screen.size().width(), screen.size().height())
+    if target <= 0:
+        return cv2.IMREAD_COLOR, 1
+
+    for flag, factor in ((cv2.IMREAD_REDUCED_COLOR_8, 8),
+                         (cv2.IMREAD_REDUCED_COLOR_4, 4),
+                         (cv2.IMREAD_REDUCED_COLOR_2, 2)):
+        if h > factor * target and w > factor * target:
+            return flag, factor
+    return cv2.IMREAD_COLOR, 1
+
+
+def _decode_into(img_path: str, slot: np.ndarray, flag: int = cv2.IMREAD_COLOR,
+                 factor: int = 1) -> bool:
+    """Decode one image into its preallocated frame slot (thread worker).
+
+    Decoding releases the GIL (both cv2.imread and TurboJPEG), so running
+    these in a thread pool gives near-linear speedup on multicore machines.
+    JPEGs go through libjpeg-turbo when available; factor mirrors the
+    IMREAD_REDUCED flag so both decoders produce the same output size.
+    """
+    img = None
+    if _turbo_jpeg is not None and img_path.lower().endswith((".jpg", ".jpeg")):
+        try:
+            with open(img_path, "rb") as f:
+                img = _turbo_jpeg.decode(f.read(), pixel_format=TJPF_BGR,
+                                         scaling_factor=(1, factor))
+        except (OSError, IOError, ValueError):
+            img = None  # odd/corrupt JPEG: retry with OpenCV below
+    if img is None:
+        img = cv2.imread(img_path, flag)
+    if img is None:
+        logger.warning(f"Failed to read image: {img_path}")
+        return False
+    # Mismatched images get resized straight into the slot; matching ones
+    # are copied (frames stay in decoder-native BGR, no channel swap)
+    if img.shape[:2] != slot.shape[:2]:
+        cv2.resize(img, (slot.shape[1], slot.shape[0]), dst=slot,
+                   interpolation=cv2.INTER_LINEAR)
+    else:
+        np.copyto(slot, img)
+    return True
+
+class _StreamingVideoSource:
+    """On-demand frame access for videos too long to hold in RAM.
+
+    Mimics the preloaded (N, H, W, 3) frame stacks where it matters: len(),
+    .shape and integer indexing all work, but frames are decoded on first
+    access and kept in a small LRU instead of being sampled into memory.
+    Sequential access (playback) decodes forward without seeking; random
+    access seeks via CAP_PROP_POS_FRAMES.
+    """
+
+    CACHE_SIZE = 128
+    # Forward gaps up to this many frames are discarded with grab();
+    # larger (or backward) jumps seek. Roughly one GOP: a POS_FRAMES seek
+    # re-decodes from the nearest keyframe anyway, so decode-and-discard
+    # is cheaper for anything shorter.
+    SEEK_AHEAD_MAX = 30
+
+    def __init__(self, video_path: str, cap, n: int, w: int, h: int):
+        self._path = video_path
+        self._cap = cap
+        self._n = n
+        self._out_w = w
+        self._out_h = h
+        self._interp = cv2.INTER_LINEAR
+        self._next_pos = 0  # frame index the capture will decode next
+        self._cache = collections.OrderedDict()
+
+    @property
+    def shape(self):
+        return self._n, self._out_h, self._out_w, 3
+
+    def __len__(self):
+        return self._n
+
+    def set_output_size(self, w: int, h: int, interpolation=cv2.INTER_LINEAR):
+        """Resize decoded frames to (w, h), e.g. to match the reference."""
+        if (w, h) != (self._out_w, self._out_h):
+            self._out_w = w
+            self._out_h = h
+            self._interp = interpolation
+            self._cache.clear()
+
+    def _decode(self, idx: int):
+        """Decode frame idx (native BGR), seeking only when discarding is worse.
+
+        Skipping a frame or two to catch up is the wall-clock scheduler's
+        normal recovery path, so small forward gaps grab()-discard the
+        intervening frames instead of paying a keyframe seek per tick.
+        """
+        gap = idx - self._next_pos
+        if 0 < gap <= self.SEEK_AHEAD_MAX:
+            for _ in range(gap):
+                if not self._cap.grab():
+                    break
+        elif gap != 0:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+        ok, bgr = self._cap.read()
+        self._next_pos = idx + 1
+        return bgr if ok else None
+
+    def __getitem__(self, idx: int) -> np.ndarray:
+        idx = int(idx)
+        if idx < 0:
+            idx += self._n
+
+        frame = self._cache.get(idx)
+        if frame is not None:
+            self._cache.move_to_end(idx)
+            return frame
+
+        # _decode updates _next_pos itself: only the decoder knows where it
+        # actually landed (PyAV pts rounding can overshoot the target)
+        frame = self._decode(idx)
+        if frame is None:
+            # Return a black frame rather than crash on a damaged tail
+            logger.warning(f"Failed to decode frame {idx} of {self._path}")
+            frame = np.zeros((self._out_h, self._out_w, 3), dtype=np.uint8)
+        elif frame.shape[:2] != (self._out_h, self._out_w):
+            frame = cv2.resize(frame, (self._out_w, self._out_h),
+                               interpolation=self._interp)
+
+        self._cache[idx] = frame
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return frame
+
+    def release(self):
+        self._cap.release()
+        self._cache.clear()
+
+
+class _PyAVVideoSource(_StreamingVideoSource):
+    """Streaming source decoding through PyAV (used when av is installed).
+
+    cv2.VideoCapture random access decodes from the nearest keyframe on
+    every CAP_PROP_POS_FRAMES set. Here the codec runs multi-threaded
+    (thread_type AUTO), sequential playback continues a plain forward scan
+    with no seeking at all, and random access seeks to the nearest prior
+    keyframe once and rolls forward to the target.
+    """
+
+    def __init__(self, video_path: str, n: int):
+        container = av.open(str(video_path))
+        stream = container.streams.video[0]
+        stream.thread_type = "AUTO"
+        super().__init__(video_path, None, stream.frames or n,
+                         stream.codec_context.width, stream.codec_context.height)
+        self._container = container
+        self._stream = stream
+        self._frames_iter = container.decode(stream)
+        # pts units per frame, for index <-> timestamp conversion
+        if stream.average_rate:
+            self._pts_per_frame = 1.0 / (float(stream.average_rate)
+                                         * float(stream.time_base))
+        else:
+            self._pts_per_frame = None
+
+    def _decode(self, idx: int):
+        gap = idx - self._next_pos
+        if self._pts_per_frame and (gap < 0 or gap > self.SEEK_AHEAD_MAX):
+            # Backward or far forward: one keyframe seek plus rollforward.
+            # Small forward gaps just scan the open iterator below —
+            # decoding a frame or two beats re-decoding from the prior
+            # keyframe.
+            self._container.seek(int(idx * self._pts_per_frame),
+                                 stream=self._stream, backward=True,
+                                 any_frame=False)
+            self._frames_iter = self._container.decode(self._stream)
+        for frame in self._frames_iter:
+            if frame.pts is not None and self._pts_per_frame:
+                fidx = int(round(frame.pts / self._pts_per_frame))
+            else:
+                fidx = idx
+            if fidx >= idx:
+                # Record where the decoder actually sits: pts rounding can
+                # land past idx, and assuming idx+1 would leave every later
+                # sequential read permanently offset by the difference
+                self._next_pos = fidx + 1
+                return frame.to_ndarray(format="bgr24")
+        self._next_pos = idx + 1
+        return None
+
+    def release(self):
+        self._container.close()
+        self._cache.clear()
+
+
 class VideoComparator:
     """Handles video/image loading and frame-level comparison."""
 
+    # Max number of memoized diff results (triplets) kept for scrubbing
+    DIFF_CACHE_SIZE = 64
+    # Videos longer than this stream on demand instead of loading into RAM
+    EAGER_LOAD_MAX = 300
+
     def __init__(self):
         self.ref_frames = []
         self.comp_frames = []
         self.ref_info = None
         self.comp_info = None
         self.current_frame_idx = 0
+        # Reference dimensions cached as plain ints for the hover hot path
+        self._ref_w = 0
+        self._ref_h = 0
+        # Common frame count, recomputed on load instead of per call
+        self._n_common = 0
+        # LRU of idx -> (ref, comp, diff) so scrubbing back and forth
+        # returns cached results instead of recomputing identical diffs
+        self._diff_cache = collections.OrderedDict()
+        # Shared-memory blocks backing the frame buffers, each paired with a
+        # weak reference to its array so replaced stacks can be unlinked
+        # (see _alloc_frames/_prune_shm). Both run on load-worker threads
+        # and two loads can be in flight at once, so the list is lock-guarded
+        self._shm_blocks = []
+        self._shm_lock = threading.Lock()
+
+    def _alloc_frames(self, count: int, h: int, w: int) -> np.ndarray:
+        """Allocate a (count, H, W, 3) uint8 frame buffer in shared memory.
+
+        Decode workers write slots while the GUI thread reads without any
+        GIL-protected copies, and the block can be handed to other processes
+        if needed. Falls back to a heap allocation when the shared-memory
+        segment cannot be created (e.g. a small /dev/shm).
+        """
+        self._prune_shm()
+        try:
+            shm = shared_memory.SharedMemory(create=True, size=max(1, count * h * w * 3))
+        except OSError:
+            logger.warning("Shared-memory allocation failed, using heap buffer")
+            return np.empty((count, h, w, 3), dtype=np.uint8)
+        arr = np.ndarray((count, h, w, 3), dtype=np.uint8, buffer=shm.buf)
+        with self._shm_lock:
+            self._shm_blocks.append((shm, weakref.ref(arr)))
+        return arr
+
+    def _prune_shm(self):
+        """Unlink shared-memory blocks whose frame stacks have been dropped.
+
+        A dead weak reference means no array (and no view of one) can touch
+        the buffer any more, so the close cannot fail on exports. Without
+        this, every re-load and every comparison resize would pin another
+        full-size /dev/shm segment for the process lifetime.
+        """
+        with self._shm_lock:
+            kept = []
+            for shm, ref in self._shm_blocks:
+                if ref() is not None:
+                    kept.append((shm, ref))
+                    continue
+                try:
+                    shm.close()
+                    shm.unlink()
+                except OSError:
+                    pass
+            self._shm_blocks = kept
+
+    def close(self):
+        """Release streaming captures and shared-memory frame buffers."""
+        for source in (self.ref_frames, self.comp_frames):
+            if isinstance(source, _StreamingVideoSource):
+                source.release()
+        self.ref_frames = []
+        self.comp_frames = []
+        self._n_common = 0
+        self._diff_cache.clear()
+        with self._shm_lock:
+            blocks, self._shm_blocks = self._shm_blocks, []
+        for shm, _ in blocks:
+            try:
+                shm.close()
+                shm.unlink()
+            except (BufferError, OSError):
+                # A view may still be alive; the OS reclaims at process exit
+                pass
+
+    def __del__(self):
+        self.close()
 
     def load_video(self, video_path: str):
-        """Load video and extract frames (limited to ~300 frames for performance)."""
+        """Load video: short ones eagerly into RAM, long ones streamed.
+
+        Videos up to EAGER_LOAD_MAX frames are decoded into a contiguous
+        frame buffer. Longer videos used to be sampled down to ~300 frames;
+        they now get a _StreamingVideoSource giving frame-accurate access to
+        the full range, decoding on demand with a small LRU.
+        """
         if not video_path or not Path(video_path).exists():
             logger.error(f"Video path invalid or doesn't exist: {video_path}")
             return None
@@ -98,25 +474,84 @@ class VideoComparator:
             logger.error(f"Failed to open video: {video_path}")
             return None
 
-        frames = []
         w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         n = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        step = max(1, n // 300)  # Sample frames to limit memory usage
 
-        i = 0
-        while True:
+        if n > self.EAGER_LOAD_MAX:
+            if av is not None:
+                try:
+                    source = _PyAVVideoSource(video_path, n)
+                    cap.release()
+                    logger.info(f"Streaming video via PyAV: {video_path} - {w}x{h}, {len(source)} frames")
+                    return {"frames": source, "width": w, "height": h,
+                            "count": len(source)}
+                except Exception:
+                    logger.exception(f"PyAV streaming failed, using OpenCV capture: {video_path}")
+            # The source keeps the capture; it is released via close()
+            source = _StreamingVideoSource(video_path, cap, n, w, h)
+            logger.info(f"Streaming video on demand: {video_path} - {w}x{h}, {n} frames")
+            return {"frames": source, "width": w, "height": h, "count": n}
+
+        if av is not None:
+            try:
+                info = self._load_video_av(video_path)
+                if info is not None:
+                    cap.release()
+                    return info
+            except Exception:
+                logger.exception(f"PyAV decode failed, falling back to OpenCV: {video_path}")
+
+        # One contiguous (K, H, W, 3) buffer instead of K scattered arrays;
+        # frames stay in decoder-native BGR (displayed via Format_BGR888).
+        # Cap at 301 slots when the container doesn't report a frame count.
+        frames = self._alloc_frames(n + 1 if n else 301, h, w)
+        j = 0
+        while j < frames.shape[0]:
             ok, frame = cap.read()
             if not ok:
                 break
-            if i % step == 0:
-                frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-            i += 1
+            frames[j] = frame
+            j += 1
 
         cap.release()
+        frames = frames[:j]
         logger.info(f"Loaded video: {video_path} - {w}x{h}, {len(frames)} frames")
         return {"frames": frames, "width": w, "height": h, "count": len(frames)}
 
+    def _load_video_av(self, video_path: str):
+        """Load video through PyAV (fast path when the av package is present).
+
+        The decoder runs multi-threaded (thread_type AUTO) and to_ndarray
+        converts to BGR24 inside libswscale, so no Python-side cvtColor pass
+        is needed per kept frame.
+        """
+        container = av.open(str(video_path))
+        stream = container.streams.video[0]
+        stream.thread_type = "AUTO"
+        w = stream.codec_context.width
+        h = stream.codec_context.height
+        n = stream.frames or 0
+        step = max(1, n // 300)  # Sample frames to limit memory usage
+
+        # Cap at 301 slots when the container doesn't report a frame count
+        frames = self._alloc_frames(n // step + 1 if n else 301, h, w)
+        i = j = 0
+        for frame in container.decode(stream):
+            if i % step == 0:
+                if j >= frames.shape[0]:
+                    break
+                frames[j] = frame.to_ndarray(format="bgr24")
+                j += 1
+            i += 1
+        container.close()
+
+        if j == 0:
+            return None
+        frames = frames[:j]
+        logger.info(f"Loaded video (PyAV): {video_path} - {w}x{h}, {len(frames)} frames")
+        return {"frames": frames, "width": w, "height": h, "count": len(frames)}
+
     '''
     def _load_video_folder(self, video_path: str):
         """Load video folder"""
@@ -139,37 +574,51 @@ class VideoComparator:
             return None
 
         # Supported image extensions
-        image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.webp'}
+        image_extensions = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.webp')
 
-        # Get all image files and sort them
-        image_files = []
-        for filename in sorted(os.listdir(folder_path)):
-            if Path(filename).suffix.lower() in image_extensions:
-                image_files.append(os.path.join(folder_path, filename))
+        # Get all image files and sort them. os.scandir + endswith keeps the
+        # scan to one syscall per entry, with no pathlib objects per file.
+        with os.scandir(folder_path) as it:
+            image_files = [e.path for e in it
+                           if e.is_file() and e.name.lower().endswith(image_extensions)]
+        image_files.sort()
 
         if not image_files:
             logger.error(f"No image files found in folder: {folder_path}")
             return None
 
-        frames = []
+        # Probe the first readable image for dimensions
         w, h = None, None
-
+        probe_path = None
         for img_path in image_files:
-            img = cv2.imread(img_path)
-            if img is None:
-                logger.warning(f"Failed to read image: {img_path}")
-                continue
-
-            # Get dimensions from first image
-            if w is None:
-                h_img, w_img, _ = img.shape
-                w, h = w_img, h_img
+            probe = cv2.imread(img_path)
+            if probe is not None:
+                h, w = probe.shape[:2]
+                probe_path = img_path
+                break
 
-            # Convert BGR to RGB
-            rgb_img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            frames.append(rgb_img)
+        if w is None:
+            logger.error(f"No valid images loaded from folder: {folder_path}")
+            return None
 
-        if not frames:
+        # Decode at reduced resolution when the source dwarfs the screen
+        flag, factor = _reduced_imread_flag(h, w)
+        if factor > 1:
+            probe = cv2.imread(probe_path, flag)
+            h, w = probe.shape[:2]
+            logger.info(f"Decoding folder at 1/{factor} resolution ({w}x{h})")
+
+        # Decode all images in parallel into the preallocated frame buffer
+        frames = self._alloc_frames(len(image_files), h, w)
+        workers = min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            oks = list(pool.map(partial(_decode_into, flag=flag, factor=factor),
+                                image_files, frames))
+
+        if not all(oks):
+            # Drop slots whose image failed to decode, preserving order
+            frames = frames[np.nonzero(oks)[0]]
+        if len(frames) == 0:
             logger.error(f"No valid images loaded from folder: {folder_path}")
             return None
 
@@ -178,88 +627,291 @@ class VideoComparator:
 
     def set_ref(self, info):
         """Set reference video frames."""
+        old = self.ref_frames
         self.ref_frames = info["frames"]
         self.ref_info = info
+        if isinstance(old, _StreamingVideoSource) and old is not self.comp_frames:
+            old.release()
+        self._ref_w = info["width"]
+        self._ref_h = info["height"]
+        self._diff_cache.clear()
+        self._match_comp_to_ref()
+        self._update_frame_count()
+        old = None  # drop the last strong ref so the old stack can be unlinked
+        self._prune_shm()
 
     def set_comp(self, info):
         """Set comparison video frames."""
+        old = self.comp_frames
         self.comp_frames = info["frames"]
         self.comp_info = info
+        if isinstance(old, _StreamingVideoSource) and old is not self.ref_frames:
+            old.release()
+        self._diff_cache.clear()
+        self._match_comp_to_ref()
+        self._update_frame_count()
+        old = None  # drop the last strong ref so the old stack can be unlinked
+        self._prune_shm()
+
+    def _match_comp_to_ref(self):
+        """Resize the whole comparison stack to reference dimensions once.
+
+        Ref/comp dimensions never change after load, so resizing here (instead
+        of per frame in get_frame_triplet/get_pixel_info) removes one bilinear
+        resize from every slider tick and mouse move.
+        """
+        if self.ref_info is None or len(self.comp_frames) == 0:
+            return
+        h, w = self.ref_info["height"], self.ref_info["width"]
+        if self.comp_frames.shape[1:3] == (h, w):
+            return
+
+        # INTER_AREA when shrinking (better quality, no moiré), INTER_LINEAR
+        # when enlarging
+        if self.comp_frames.shape[1] > h or self.comp_frames.shape[2] > w:
+            interp = cv2.INTER_AREA
+        else:
+            interp = cv2.INTER_LINEAR
+
+        if isinstance(self.comp_frames, _StreamingVideoSource):
+            # Streamed frames get resized as they are decoded
+            self.comp_frames.set_output_size(w, h, interpolation=interp)
+            self.comp_info["width"] = w
+            self.comp_info["height"] = h
+            logger.info(f"Streaming comparison resized on decode to: {w}x{h}")
+            return
+
+        resized = self._alloc_frames(self.comp_frames.shape[0], h, w)
+        for i in range(self.comp_frames.shape[0]):
+            cv2.resize(self.comp_frames[i], (w, h), dst=resized[i],
+                       interpolation=interp)
+        self.comp_frames = resized
+        # Keep comp_info consistent with the stored frames so a later
+        # swap_left_right still pairs matching dimensions with each side
+        self.comp_info["frames"] = resized
+        self.comp_info["width"] = w
+        self.comp_info["height"] = h
+        logger.info(f"Resized comparison frames to reference size: {w}x{h}")
+
+    def _update_frame_count(self):
+        """Recompute the cached common frame count after a load."""
+        if len(self.ref_frames) == 0 or len(self.comp_frames) == 0:
+            self._n_common = 0
+        else:
+            self._n_common = min(self.ref_frames.shape[0], self.comp_frames.shape[0])
 
     def frame_count(self):
         """Return number of common frames (minimum of both videos)."""
-        if not (self.ref_frames and self.comp_frames):
-            return 0
-        return min(len(self.ref_frames), len(self.comp_frames))
+        return self._n_common
 
     def get_frame_triplet(self, idx: int, compute_diff: bool = True):
-        """Get reference, comparison, and optional difference frames at index."""
-        if self.frame_count() == 0:
+        """Get reference, comparison, and optional difference frames at index.
+
+        The diff stays in uint8 end to end: absdiff output is bounded to
+        [0, 255], so no float normalization or clipping is ever needed.
+
+        With compute_diff=False (the playback path when the diff panel is
+        hidden) this performs no allocations at all: both frames come back
+        as views into the preloaded, pre-resized frame stacks.
+        """
+        n = self.frame_count()
+        if n == 0:
             return None, None, None
 
-        idx = max(0, min(self.frame_count() - 1, int(idx)))
+        idx = max(0, min(n - 1, int(idx)))
         self.current_frame_idx = idx
+        return self._compute_triplet(idx, compute_diff)
+
+    def warm_triplet(self, idx: int, compute_diff: bool = True):
+        """Precompute (and cache) a triplet without touching current_frame_idx.
 
+        The playback read-ahead worker runs this off the GUI thread; the
+        hover path reads current_frame_idx, so the current index must stay
+        with the frame actually on screen, not the one being warmed.
+        """
+        n = self.frame_count()
+        if n:
+            self._compute_triplet(max(0, min(n - 1, int(idx))), compute_diff)
+
+    def _compute_triplet(self, idx: int, compute_diff: bool):
+        """Shared triplet computation behind get_frame_triplet/warm_triplet."""
         ref = self.ref_frames[idx]
-        comp_raw = self.comp_frames[idx]
-
-        # Resize comparison to match reference dimensions (only if needed)
-        if comp_raw.shape[:2] != (self.ref_info["height"], self.ref_info["width"]):
-            comp_resized = cv2.resize(
-                comp_raw,
-                (self.ref_info["width"], self.ref_info["height"]),
-                interpolation=cv2.INTER_LINEAR,
-            )
-        else:
-            comp_resized = comp_raw
+        # Comparison frames are already resized to reference dimensions at load
+        comp_resized = self.comp_frames[idx]
 
         if not compute_diff:
             return ref, comp_resized, None
 
-        # Fast difference calculation using uint8 math (Chebyshev distance)
-        diff_uint = cv2.absdiff(ref, comp_resized)
-        mag = np.max(diff_uint, axis=2).astype(np.float32) / 255.0
-        mag = np.clip(mag, 0.0, 1.0)
+        # Frames are immutable after load, so returning cached views is safe
+        cached = self._diff_cache.get(idx)
+        if cached is not None:
+            self._diff_cache.move_to_end(idx)
+            return cached
 
         h, w = ref.shape[:2]
-        diff_rgb = np.zeros((h, w, 3), dtype=np.uint8)
-        diff_rgb[:, :, 0] = (mag * 255).astype(np.uint8)        # Red channel
-        diff_rgb[:, :, 2] = ((1.0 - mag) * 255).astype(np.uint8)  # Blue channel
+        if _diff_kernel is not None:
+            # Single fused pass over the pixels, parallel across rows
+            d = np.empty((h, w), dtype=np.uint8)
+            _diff_kernel(ref, comp_resized, d)
+        else:
+            # Luminance absdiff: one channel instead of three through the
+            # whole compute and cache
+            ref_gray = cv2.cvtColor(ref, cv2.COLOR_BGR2GRAY)
+            comp_gray = cv2.cvtColor(comp_resized, cv2.COLOR_BGR2GRAY)
+            d = cv2.absdiff(ref_gray, comp_gray)
+
+        # The diff stays single-channel end to end; Qt applies the palette
+        # via the indexed-color blit in ndarray_to_pixmap
+        self._diff_cache[idx] = (ref, comp_resized, d)
+        if len(self._diff_cache) > self.DIFF_CACHE_SIZE:
+            self._diff_cache.popitem(last=False)
+
+        return ref, comp_resized, d
+
+    def get_frame_triplet_region(self, idx: int, rect, compute_diff: bool = True,
+                                 out_size=None, out=None):
+        """Like get_frame_triplet, but restricted to a source-space rect.
+
+        rect is (y0, y1, x0, x1) in reference coordinates. Cropping happens
+        before the diff, so the per-frame cost scales with the visible area
+        instead of the source resolution — the win when zoomed into a small
+        corner of a 4K frame. Region diffs bypass the triplet cache: the
+        rect changes with every zoom/pan step, so entries would almost
+        never be reused.
+
+        With out_size=(w, h) and the fused Numba kernel available, the crop,
+        the nearest-neighbour scale to the display size and the diff all
+        happen in a single parallel pass, and the returned frames are
+        already at display resolution (the diff single-channel).
+        """
+        n = self.frame_count()
+        if n == 0:
+            return None, None, None
+
+        idx = max(0, min(n - 1, int(idx)))
+        self.current_frame_idx = idx
+
+        y0, y1, x0, x1 = rect
+
+        if out_size is not None and _render_view is not None:
+            out_w, out_h = out_size
+            if out is not None:
+                # Caller-provided persistent buffers (one per viewer)
+                out_ref, out_comp, out_diff = out
+            else:
+                out_ref = np.empty((out_h, out_w, 3), dtype=np.uint8)
+                out_comp = np.empty((out_h, out_w, 3), dtype=np.uint8)
+                out_diff = np.empty((out_h, out_w), dtype=np.uint8)
+            _render_view(self.ref_frames[idx], self.comp_frames[idx],
+                         out_ref, out_comp, out_diff,
+                         y0, x0, y1 - y0, x1 - x0, compute_diff)
+            return out_ref, out_comp, out_diff if compute_diff else None
+        # Row-strided slices are valid OpenCV ROIs, so no copies here
+        ref = self.ref_frames[idx][y0:y1, x0:x1]
+        comp_resized = self.comp_frames[idx][y0:y1, x0:x1]
+
+        if not compute_diff:
+            return ref, comp_resized, None
 
-        return ref, comp_resized, diff_rgb
+        h, w = ref.shape[:2]
+        if _diff_kernel is not None:
+            d = np.empty((h, w), dtype=np.uint8)
+            _diff_kernel(ref, comp_resized, d)
+        else:
+            ref_gray = cv2.cvtColor(ref, cv2.COLOR_BGR2GRAY)
+            comp_gray = cv2.cvtColor(comp_resized, cv2.COLOR_BGR2GRAY)
+            d = cv2.absdiff(ref_gray, comp_gray)
+
+        return ref, comp_resized, d
 
     def get_pixel_info(self, x: int, y: int):
         """Get RGB values at (x, y) for both reference and comparison."""
         if not self.ref_info:
             return None
-        if not (0 <= x < self.ref_info["width"] and 0 <= y < self.ref_info["height"]):
+        if not (0 <= x < self._ref_w and 0 <= y < self._ref_h):
             return None
 
         ref = self.ref_frames[self.current_frame_idx]
-        comp_raw = self.comp_frames[self.current_frame_idx]
-        if comp_raw.shape[:2] != (self.ref_info["height"], self.ref_info["width"]):
-            comp_resized = cv2.resize(
-                comp_raw,
-                (self.ref_info["width"], self.ref_info["height"]),
-                interpolation=cv2.INTER_LINEAR,
-            )
-        else:
-            comp_resized = comp_raw
+        # Comparison frames are already resized to reference dimensions at load
+        comp_resized = self.comp_frames[self.current_frame_idx]
 
-        r1, g1, b1 = ref[y, x].tolist()
-        r2, g2, b2 = comp_resized[y, x].tolist()
+        # Scalar reads instead of .tolist(): no intermediate array/list
+        # allocations on a path invoked at mouse-event rate. Frames are BGR,
+        # the reported tuples stay RGB.
         return {
             "x": x,
             "y": y,
-            "img1": (int(r1), int(g1), int(b1)),
-            "img2": (int(r2), int(g2), int(b2)),
+            "img1": (int(ref[y, x, 2]), int(ref[y, x, 1]), int(ref[y, x, 0])),
+            "img2": (int(comp_resized[y, x, 2]), int(comp_resized[y, x, 1]),
+                     int(comp_resized[y, x, 0])),
         }
 
 
+class VideoLoadWorker(QObject):
+    """Runs video/folder loading on a worker thread so the GUI stays live.
+
+    Emits done(info) with the loader's info dict, or None on failure. The
+    signal crosses back to the GUI thread via Qt's queued connection, so
+    all widget updates stay on the main thread.
+    """
+
+    done = pyqtSignal(object)
+
+    def __init__(self, comparator: VideoComparator, path: str):
+        super().__init__()
+        self.comparator = comparator
+        self.path = path
+
+    def run(self):
+        try:
+            # Warm the JIT kernels here so a cold compile stalls this worker,
+            # not the GUI thread handling load completion
+            _warm_kernels()
+            if Path(self.path).is_dir():
+                info = self.comparator.load_images_from_folder(self.path)
+            else:
+                info = self.comparator.load_video(self.path)
+        except Exception:
+            # Without this, an escaping loader error (cv2.error, malformed
+            # container) would swallow the done signal: no failure dialog,
+            # and the worker/QThread pair would leak in _load_workers
+            logger.exception(f"Loader crashed for {self.path}")
+            info = None
+        self.done.emit(info)
+
+
 # ============================================================================
 # IMAGE VIEWER WIDGET
 # ============================================================================
 
+# Qt color table mirroring _DIFF_LUT (BGR rows -> qRgb), built once so the
+# single-channel diff can be handed to Qt as an indexed image
+_DIFF_COLORTABLE = [qRgb(int(_DIFF_LUT[i, 0, 2]), int(_DIFF_LUT[i, 0, 1]),
+                         int(_DIFF_LUT[i, 0, 0])) for i in range(256)]
+
+
+def ndarray_to_pixmap(arr: np.ndarray) -> QPixmap:
+    """Wrap a BGR or single-channel ndarray in a QPixmap without copying.
+
+    Frames stay in OpenCV's native BGR order all the way here; Format_BGR888
+    lets Qt read them as-is, so no channel swap ever runs. Single-channel
+    arrays (the diff magnitude map) become Format_Indexed8 with the diff
+    palette as color table: Qt's raster engine expands the palette during
+    the blit, so only one byte per pixel ever crosses into Qt. The QImage
+    references arr's memory directly, so row-strided crops must be
+    compacted first — QImage rejects non-contiguous buffers (the copy is
+    released once QPixmap.fromImage has converted it).
+    """
+    if not arr.flags["C_CONTIGUOUS"]:
+        arr = np.ascontiguousarray(arr)
+    h, w = arr.shape[:2]
+    if arr.ndim == 2:
+        qimg = QImage(arr.data, w, h, arr.strides[0], QImage.Format.Format_Indexed8)
+        qimg.setColorTable(_DIFF_COLORTABLE)
+    else:
+        qimg = QImage(arr.data, w, h, arr.strides[0], QImage.Format.Format_BGR888)
+    return QPixmap.fromImage(qimg)
+
 class ImageViewer(QLabel):
     """Custom QLabel for displaying images with zoom/pan/pixel hover support."""
 
@@ -276,12 +928,57 @@ class ImageViewer(QLabel):
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._dragging = False
         self._last_pos = QPoint()
+        self._last_emitted = (-1, -1)
         self.zoom_delta = 0.1
+        # Persistent render buffers: the display pipeline writes every frame
+        # into these instead of allocating, reallocating only when the label
+        # (or crop) size changes
+        self._out_buf = None
+        self._crop_buf = None
+        self._buf_version = 0
+        # Scaled-pixmap memo, filled in by _set_pixmap
+        self._img_ref = None
+        self._scale_key = None
+        self._scaled_pm = None
         # CRITICAL: Enable mouse tracking for hover events without button press
         self.setMouseTracking(True)
         # Enable drag-drop on this widget
         self.setAcceptDrops(True)
 
+    def out_buffer(self, h: int, w: int, channels: int = 3) -> np.ndarray:
+        """Display-sized scratch buffer, reallocated only when the size changes.
+
+        channels=1 yields a 2-d buffer (the diff viewer stays single-channel
+        all the way to Qt). Every handout bumps _buf_version because the
+        caller is about to overwrite the contents; _set_pixmap keys its
+        scaled-pixmap memo on the version so a recycled buffer id can never
+        serve a stale pixmap.
+        """
+        shape = (h, w, channels) if channels > 1 else (h, w)
+        if self._out_buf is None or self._out_buf.shape != shape:
+            self._out_buf = np.empty(shape, dtype=np.uint8)
+        self._buf_version += 1
+        return self._out_buf
+
+    def crop_buffer(self, h: int, w: int, channels: int = 3) -> np.ndarray:
+        """Zeroed crop-sized scratch for the edge-padded zoom path.
+
+        channels=1 yields a 2-d buffer so the single-channel diff stays
+        single-channel through the pad path.
+        """
+        shape = (h, w, channels) if channels > 1 else (h, w)
+        if self._crop_buf is None or self._crop_buf.shape != shape:
+            self._crop_buf = np.zeros(shape, dtype=np.uint8)
+        else:
+            self._crop_buf[:] = 0
+        return self._crop_buf
+
+    def resizeEvent(self, event):
+        """Invalidate the scaled-pixmap memo: its key embeds the old size."""
+        self._scale_key = None
+        self._scaled_pm = None
+        super().resizeEvent(event)
+
     def mousePressEvent(self, event):
         """Handle mouse press for pan start."""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -361,7 +1058,13 @@ class ImageViewer(QLabel):
 
         # Only emit if within image bounds
         if 0 <= x < img_w and 0 <= y < img_h:
-            self.pixel_hovered.emit(int(x), int(y))
+            ix, iy = int(x), int(y)
+            # At zoom > 1 many widget pixels map to the same image pixel;
+            # skip the signal round-trip when the coordinate hasn't changed
+            if (ix, iy) == self._last_emitted:
+                return
+            self._last_emitted = (ix, iy)
+            self.pixel_hovered.emit(ix, iy)
 
 
 # ============================================================================
@@ -390,15 +1093,56 @@ class VideoComparatorApp(QMainWindow):
         self.is_playing = False
         self.loop_enabled = True
 
-        # Playback timer
+        # Playback timer: fires at a constant short interval; the frame to
+        # show is derived from elapsed wall time, not from tick counting
         self.playback_timer = QTimer()
         self.playback_timer.timeout.connect(self.advance_frame)
+        self._play_t0 = 0.0
+        self._play_start_frame = 0
+        self._sched_frame = 0  # last frame the schedule itself displayed
+
+        # Render coalescing: bursts of zoom/pan/toggle events schedule one
+        # deferred render of the latest state instead of stacking redraws
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(0)
+        self._render_timer.timeout.connect(self._do_render)
+
+        # Hover throttling: mouse moves only record the position; the label
+        # text renders at most once per 16 ms (~60 Hz)
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(16)
+        self._hover_timer.timeout.connect(self._show_hover_info)
+        self._pending_hover = None
+        self._last_hover_key = None
 
         # state for diff visibility
         self.diff_visible = True
 
-        self._zoom_buffer = None
-        self._zoom_buffer_shape = None
+        # Active load workers (kept alive until their QThread finishes)
+        self._load_workers = []
+
+        # Rotated frames keyed by (id(img), angle); entries keep a reference
+        # to the source array so the id stays valid while cached
+        self._rot_cache = {}
+
+        # Resolved view geometry (label size, visible source rect), reused
+        # across frames until zoom/pan/rotation/fit changes it
+        self._view_plan = None
+
+        # One-deep playback read-ahead: while frame N is on screen a worker
+        # computes N+1 into the comparator's triplet cache (OpenCV releases
+        # the GIL, so it truly overlaps with Qt painting)
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1,
+                                                 thread_name_prefix="prefetch")
+        self._prefetch = {}
+
+        # Per-display transform pool: cv2.rotate/resize release the GIL and
+        # each viewer writes its own buffers, so the ref/comp/diff transforms
+        # run concurrently and a frame costs the slowest of the three
+        self._xform_pool = ThreadPoolExecutor(max_workers=3,
+                                              thread_name_prefix="xform")
 
         # Set focus policy so main window captures keys
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -410,7 +1154,10 @@ class VideoComparatorApp(QMainWindow):
 
     @property
     def zoom_delta(self):
-        return np.clip(self.zoom / 10, min=0.1, max=0.4)
+        # Plain-Python clamp: np.clip on a scalar costs a full ufunc
+        # dispatch plus a 0-d array per wheel tick / key repeat
+        v = self.zoom * 0.1
+        return 0.1 if v < 0.1 else 0.4 if v > 0.4 else v
 
     def eventFilter(self, obj, event):
         """Intercept events before widgets process them."""
@@ -511,6 +1258,8 @@ class VideoComparatorApp(QMainWindow):
         self.speed_spinbox.setSingleStep(0.1)
         self.speed_spinbox.setDecimals(1)
         self.speed_spinbox.setMaximumWidth(70)
+        # Rebase the playback schedule so speed changes apply mid-play
+        self.speed_spinbox.valueChanged.connect(self.update_playback_timer)
         controls_layout.addWidget(self.speed_spinbox)
 
         # Rotation buttons
@@ -662,25 +1411,32 @@ class VideoComparatorApp(QMainWindow):
             QMessageBox.warning(self, "Error", f"Path does not exist: {file_path}")
             return
 
-        info = None
-
         if path_obj.is_file():
-            # Try to load as video
             ext = path_obj.suffix.lower()
-            if ext in ['.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv']:
-                info = self.comparator.load_video(file_path)
-            else:
+            if ext not in ['.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv']:
                 QMessageBox.warning(self, "Error", f"Unsupported file type: {ext}")
                 return
 
-        elif path_obj.is_dir():
-            # Load as image folder
-            info = self.comparator.load_images_from_folder(file_path)
-
+        # Decode on a worker thread so the UI doesn't freeze on large files
+        thread = QThread(self)
+        worker = VideoLoadWorker(self.comparator, file_path)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.done.connect(
+            lambda info: self._on_load_done(info, file_path, is_reference))
+        worker.done.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        # Keep worker alive until its thread finishes
+        self._load_workers.append(worker)
+        thread.finished.connect(lambda: self._load_workers.remove(worker))
+        thread.start()
+
+    def _on_load_done(self, info, file_path: str, is_reference: bool):
+        """Receive the loader result on the GUI thread."""
         if info is None:
             QMessageBox.warning(self, "Error", f"Failed to load: {file_path}")
             return
-
         self._set_source_info(info, file_path, is_reference)
 
     def _set_source_info(self, info: dict, file_path: str, is_reference: bool):
@@ -717,6 +1473,7 @@ class VideoComparatorApp(QMainWindow):
         self.pan_x = 0
         self.pan_y = 0
         self.rotation_angle = 0
+        self._view_plan = None
         self.is_playing = False
         self.play_btn.setText("▶ Play")
         self.playback_timer.stop()
@@ -731,19 +1488,21 @@ class VideoComparatorApp(QMainWindow):
     def toggle_diff_view(self):
         """Show/hide the difference viewer and skip its computation when hidden."""
         self.diff_visible = not self.diff_visible
+        self._prefetch.clear()  # pending read-ahead used the old diff flag
         if self.diff_visible:
             self.diff_toggle_btn.setText("Hide Diff")
             self.right_panel_widget.show()
         else:
             self.diff_toggle_btn.setText("Show Diff")
             self.right_panel_widget.hide()
-        self.on_frame_changed(self.frame_slider.value())
+        self._schedule_render()
 
     # ========================================================================
     # FRAME DISPLAY & TRANSFORMS
     # ========================================================================
 
-    def _apply_view_transform(self, img: np.ndarray, do_print=False) -> np.ndarray:
+    def _apply_view_transform(self, img: np.ndarray, view: ImageViewer,
+                              do_print=False) -> np.ndarray:
         """
         Apply rotation, zoom, and pan transformations to image.
 
@@ -754,94 +1513,264 @@ class VideoComparatorApp(QMainWindow):
         Important: Returns raw crop (not resized) to maximize pixel usage. Qt's pixmap
         scaling in _set_pixmap handles fitting to the label widget.
         """
-        # 1) Apply rotation (changes image w,h)
-        if self.rotation_angle == 90:
-            img = cv2.rotate(img, cv2.ROTATE_90_CLOCKWISE)
-        elif self.rotation_angle == 180:
-            img = cv2.rotate(img, cv2.ROTATE_180)
-        elif self.rotation_angle == 270:
-            img = cv2.rotate(img, cv2.ROTATE_90_COUNTERCLOCKWISE)
+        # 1) Apply rotation (changes image w,h). Rotations are cached per
+        # source frame so pan/zoom redraws don't re-rotate the full image.
+        if self.rotation_angle in (90, 180, 270):
+            key = (id(img), self.rotation_angle)
+            entry = self._rot_cache.get(key)
+            if entry is None:
+                if self.rotation_angle == 90:
+                    rotated = cv2.rotate(img, cv2.ROTATE_90_CLOCKWISE)
+                elif self.rotation_angle == 180:
+                    rotated = cv2.rotate(img, cv2.ROTATE_180)
+                else:
+                    rotated = cv2.rotate(img, cv2.ROTATE_90_COUNTERCLOCKWISE)
+                if len(self._rot_cache) >= 3:
+                    # Only the current ref/comp/diff triplet is worth keeping
+                    self._rot_cache.clear()
+                self._rot_cache[key] = (img, rotated)
+            else:
+                rotated = entry[1]
+            img = rotated
 
-        return self._zoom_in1(img, do_print=do_print)
+        return self._zoom_in1(img, view, do_print=do_print)
 
-    # -> ndarray[tuple[int, ...], dtype[_SCT]]:
-    def _zoom_in1(self, img: Mat | ndarray[Any, dtype[integer[Any] | floating[Any]]] | ndarray, do_print=False) -> ndarray:
+    def _crop_rect(self, h: int, w: int):
+        """Clamp pan and return the source crop rectangle for an h x w image.
+
+        Shared by _zoom_in1 and the visible-region diff path so both see the
+        exact same rectangle. Returns (y0, y1, x0, x1, crop_h, crop_w,
+        out_h, out_w); the rectangle is already clipped to the image on the
+        start side, the end side may exceed the image (edge-padded path).
+        """
         out_h, out_w = self.left_view.height(), self.left_view.width()
         crop_h, crop_w = int(out_h // self.zoom // 2) * 2, int(out_w // self.zoom // 2) * 2
-        target_shape = (crop_h, crop_w, 3)
-
-        # Check if we need to reallocate
-        if self._zoom_buffer_shape != target_shape:
-            self._zoom_buffer = np.zeros(target_shape, dtype=img.dtype)
-            self._zoom_buffer_shape = target_shape
-        else:
-            # Reuse existing buffer, just clear it
-            self._zoom_buffer[:] = 0
 
-        out_img = self._zoom_buffer
-
-        h, w = img.shape[:2]
         img_h_c, img_w_c = h // 2, w // 2
 
-        # Pan the center
-        clamped_h = int(np.clip(self.pan_y, min=-img_h_c+crop_h//2, max=img_h_c-crop_h//2))
-        clamped_w = int(np.clip(self.pan_x, min=-img_w_c+crop_w//2, max=img_w_c-crop_w//2))
+        # Pan the center (plain-Python clamps: this runs per frame per view).
+        # Lower bound first, upper bound last — when the crop is larger than
+        # the image the bounds cross, and like np.clip the upper bound must
+        # win so the crop stays centered (pan 0) on the padded path.
+        clamped_h = min(img_h_c - crop_h // 2, max(-img_h_c + crop_h // 2, self.pan_y))
+        clamped_w = min(img_w_c - crop_w // 2, max(-img_w_c + crop_w // 2, self.pan_x))
         self.pan_x = clamped_w
         self.pan_y = clamped_h
         img_h_c, img_w_c = img_h_c + clamped_h, img_w_c + clamped_w
 
-        # crop and paste
-        crop_h_start, crop_w_start = max(0, img_h_c - crop_h // 2), max(0, img_w_c - crop_w // 2)
-        crop_h_end, crop_w_end = img_h_c + crop_h // 2, img_w_c + crop_w // 2
+        y0, x0 = max(0, img_h_c - crop_h // 2), max(0, img_w_c - crop_w // 2)
+        y1, x1 = img_h_c + crop_h // 2, img_w_c + crop_w // 2
+        return y0, y1, x0, x1, crop_h, crop_w, out_h, out_w
+
+    def _current_plan(self):
+        """Cached _visible_region result, recomputed only when the view moved.
+
+        During playback every input to the crop geometry (zoom, pan,
+        rotation, label size) is constant and only the frame index changes,
+        so the rect is resolved once and reused. Zoom/pan/rotation/fit
+        handlers drop the plan; label resizes invalidate it implicitly
+        because the label size is part of the stored key.
+        """
+        out_size = (self.left_view.width(), self.left_view.height())
+        plan = self._view_plan
+        if plan is not None and plan[0] == out_size:
+            return plan[1]
+        region = self._visible_region()
+        self._view_plan = (out_size, region)
+        return region
+
+    def _visible_region(self):
+        """Source-space rect covering exactly the visible crop, or None.
+
+        Only usable with no rotation and a crop fully inside the image that
+        is actually smaller than the frame; every other case (rotated view,
+        edge padding, whole frame visible) returns None and takes the
+        full-frame path.
+        """
+        if self.rotation_angle != 0 or not self.comparator.ref_info:
+            return None
+        h = self.comparator.ref_info["height"]
+        w = self.comparator.ref_info["width"]
+        y0, y1, x0, x1, crop_h, crop_w, _, _ = self._crop_rect(h, w)
+        if crop_h <= 0 or crop_w <= 0:
+            return None
+        if (y1 - y0) != crop_h or (x1 - x0) != crop_w:
+            return None
+        if crop_h >= h and crop_w >= w:
+            return None
+        return y0, y1, x0, x1
+
+    # -> ndarray[tuple[int, ...], dtype[_SCT]]:
+    def _zoom_in1(self, img: Mat | ndarray[Any, dtype[integer[Any] | floating[Any]]] | ndarray,
+                  view: ImageViewer, do_print=False) -> ndarray:
+        h, w = img.shape[:2]
+        (crop_h_start, crop_h_end, crop_w_start, crop_w_end,
+         crop_h, crop_w, out_h, out_w) = self._crop_rect(h, w)
         crop_h_actual, crop_w_actual = crop_h_end - crop_h_start, crop_w_end - crop_w_start
 
         crop = img[crop_h_start:crop_h_end, crop_w_start:crop_w_end]
-        out_img[crop_h // 2 - crop_h_actual // 2:crop_h // 2 + crop_h_actual // 2,
-        crop_w // 2 - crop_w_actual // 2:crop_w // 2 + crop_w_actual // 2] = crop
 
-        out_img = cv2.resize(out_img, (out_w, out_h), interpolation=cv2.INTER_NEAREST)
+        if crop_h_actual == crop_h and crop_w_actual == crop_w:
+            # Crop fully inside the image (the common case at zoom >= fit)
+            if crop_h >= out_h and crop_w >= out_w:
+                # Crop matches or exceeds the label: return the slice itself.
+                # At equal size the NEAREST resize was a pure memcpy; at
+                # zoom < 1 Qt's FastTransformation scale in _set_pixmap does
+                # the one downscale, avoiding a NEAREST->Qt double resample.
+                out_img = crop
+            else:
+                channels = img.shape[2] if img.ndim == 3 else 1
+                out_img = cv2.resize(crop, (out_w, out_h),
+                                     dst=view.out_buffer(out_h, out_w, channels),
+                                     interpolation=cv2.INTER_NEAREST)
+        else:
+            # Crop extends past an image edge: paste into the viewer's
+            # zero-padded scratch so the border shows black
+            channels = img.shape[2] if img.ndim == 3 else 1
+            padded = view.crop_buffer(crop_h, crop_w, channels)
+            padded[
+                crop_h // 2 - crop_h_actual // 2:crop_h // 2 + crop_h_actual // 2,
+                crop_w // 2 - crop_w_actual // 2:crop_w // 2 + crop_w_actual // 2] = crop
+            out_img = cv2.resize(padded, (out_w, out_h),
+                                 dst=view.out_buffer(out_h, out_w, channels),
+                                 interpolation=cv2.INTER_NEAREST)
+
         if do_print:
+            # %-style args: formatting only runs if a handler wants DEBUG
             logger.debug(
-                f"Transform (x,y): rot={self.rotation_angle}°, zoom={self.zoom:.2f}, "
-                f"img={w}x{h}, crop={crop_w_actual}x{crop_h_actual}, output={out_w}x{out_h}, "
-                f"pan=({self.pan_x},{self.pan_y}))"
+                "Transform (x,y): rot=%s°, zoom=%.2f, img=%dx%d, crop=%dx%d, "
+                "output=%dx%d, pan=(%d,%d))",
+                self.rotation_angle, self.zoom, w, h, crop_w_actual,
+                crop_h_actual, out_w, out_h, self.pan_x, self.pan_y,
             )
-        # CRITICAL: Ensure contiguous memory layout for QImage conversion
-        return np.ascontiguousarray(out_img)
+        # cv2.resize output is already contiguous, so no copy is needed here
+        return out_img
+
+    def _schedule_render(self):
+        """Queue a single deferred render of the current frame/view state.
+
+        A fast mouse wheel or held arrow key fires many state changes while
+        an earlier render is still running; only the latest state needs to
+        be drawn, so all of them collapse into one 0 ms single-shot timer.
+        """
+        if not self._render_timer.isActive():
+            self._render_timer.start()
+
+    def _do_render(self):
+        self.on_frame_changed(self.frame_slider.value())
 
     def on_frame_changed(self, idx: int):
         """Handle frame change: load and display new frame."""
-        compute_diff = self.diff_visible
-        ref, comp, diff = self.comparator.get_frame_triplet(idx, compute_diff=compute_diff)
+        if self.is_playing and idx != self._sched_frame:
+            # The frame changed outside the schedule (slider scrub while
+            # playing): rebase so the next tick continues from here instead
+            # of snapping back to the pre-seek timeline
+            self._play_t0 = time.perf_counter()
+            self._play_start_frame = idx
+            self._sched_frame = idx
+            self._prefetch.clear()  # read-ahead targeted the pre-seek frame
+        region = self._current_plan()
+        if region is not None:
+            out_w, out_h = self.left_view.width(), self.left_view.height()
+            bufs = (self.left_view.out_buffer(out_h, out_w),
+                    self.mid_view.out_buffer(out_h, out_w),
+                    self.right_view.out_buffer(out_h, out_w, channels=1))
+            ref, comp, diff = self.comparator.get_frame_triplet_region(
+                idx, region, compute_diff=self.diff_visible,
+                out_size=(out_w, out_h), out=bufs)
+        else:
+            ref, comp, diff = self.comparator.get_frame_triplet(
+                idx, compute_diff=self.diff_visible)
         if ref is None:
             return
-        self._display_triplet(ref, comp, diff)
+        self._display_triplet(ref, comp, diff, region=region)
         total = self.comparator.frame_count()
         self.frame_label.setText(f"{idx} / {total - 1}")
         self.pixel_info_label.setText("Hover over image to inspect pixel values")
+        if self.is_playing:
+            # Full-frame diffs only: region diffs are cheap and their rect
+            # would be stale by the time the next frame shows anyway
+            self._prefetch_next(idx, self.diff_visible and region is None)
 
-    def _display_triplet(self, ref, comp, diff):
-        """Apply transforms and display all three frames."""
-        ref_t = self._apply_view_transform(ref, do_print=True)
-        comp_t = self._apply_view_transform(comp)
+    def _prefetch_next(self, idx: int, compute_diff: bool):
+        """Warm the triplet cache for the frame that playback shows next."""
+        total = self.comparator.frame_count()
+        if total == 0:
+            return
+        nxt = idx + 1
+        if nxt >= total:
+            if not self.loop_enabled:
+                return
+            nxt = 0
+        if nxt in self._prefetch:
+            return
+        self._prefetch.clear()  # at most one outstanding future
+        self._prefetch[nxt] = self._prefetch_pool.submit(
+            self.comparator.warm_triplet, nxt, compute_diff)
 
-        self._set_pixmap(self.left_view, ref_t)
-        self._set_pixmap(self.mid_view, comp_t)
-        if diff is not None and self.diff_visible:
-            diff_t = self._apply_view_transform(diff)
-            self._set_pixmap(self.right_view, diff_t)
+    def _display_triplet(self, ref, comp, diff, region=None):
+        """Apply transforms and display all three frames.
 
-    def _set_pixmap(self, label: QLabel, img_np: np.ndarray):
+        With region set, the inputs are already cropped to the visible rect
+        and the only remaining work is the final nearest-neighbour upscale.
+        """
+        # Each viewer transform runs on its own pool worker; the OpenCV ops
+        # inside release the GIL, so the three overlap instead of summing
+        if region is not None:
+            fut_ref = self._xform_pool.submit(self._scale_region, ref, self.left_view)
+            fut_comp = self._xform_pool.submit(self._scale_region, comp, self.mid_view)
+        else:
+            fut_ref = self._xform_pool.submit(
+                self._apply_view_transform, ref, self.left_view, True)
+            fut_comp = self._xform_pool.submit(
+                self._apply_view_transform, comp, self.mid_view)
+        fut_diff = None
+        if diff is not None and self.diff_visible:
+            if region is not None:
+                fut_diff = self._xform_pool.submit(
+                    self._scale_region, diff, self.right_view)
+            else:
+                fut_diff = self._xform_pool.submit(
+                    self._apply_view_transform, diff, self.right_view)
+
+        # setPixmap must stay on the GUI thread, so collect here
+        self._set_pixmap(self.left_view, fut_ref.result())
+        self._set_pixmap(self.mid_view, fut_comp.result())
+        if fut_diff is not None:
+            # Single-channel diffs go to Qt as Format_Indexed8 with the
+            # palette as color table; no 3-channel expansion ever happens
+            self._set_pixmap(self.right_view, fut_diff.result())
+
+    def _scale_region(self, crop: np.ndarray, view: ImageViewer) -> np.ndarray:
+        """Final upscale of an already-cropped region; mirrors _zoom_in1's tail."""
+        out_h, out_w = self.left_view.height(), self.left_view.width()
+        crop_h, crop_w = crop.shape[:2]
+        if crop_h >= out_h and crop_w >= out_w:
+            return crop
+        channels = crop.shape[2] if crop.ndim == 3 else 1
+        return cv2.resize(crop, (out_w, out_h),
+                          dst=view.out_buffer(out_h, out_w, channels),
+                          interpolation=cv2.INTER_NEAREST)
+
+    def _set_pixmap(self, label: ImageViewer, img_np: np.ndarray):
         """Convert numpy image to QPixmap and set on label with aspect-aware scaling."""
         # scale_mode = Qt.TransformationMode.SmoothTransformation
         scale_mode = Qt.TransformationMode.FastTransformation
-        h, w = img_np.shape[:2]
-        qimg = QImage(img_np.data, w, h, 3 * w, QImage.Format.Format_RGB888)
-        pm = QPixmap.fromImage(qimg)
-
         label_w = label.width()
         label_h = label.height()
 
+        # Memoize the scaled pixmap: the held _img_ref keeps the array alive,
+        # so an identical id() means the exact same frame buffer. The buffer
+        # version distinguishes successive frames rendered into the viewer's
+        # persistent _out_buf, which recycles one id forever.
+        key = (id(img_np), label_w, label_h,
+               label._buf_version if img_np is label._out_buf else 0)
+        if label._scale_key == key:
+            label.setPixmap(label._scaled_pm)
+            return
+
+        pm = ndarray_to_pixmap(img_np)
+
         if label_w > 0 and label_h > 0:
             # Only scale DOWN if image is larger than label
             if pm.width() > label_w or pm.height() > label_h:
@@ -851,6 +1780,9 @@ class VideoComparatorApp(QMainWindow):
                 else:
                     pm = pm.scaledToHeight(label_h, scale_mode)
 
+        label._img_ref = img_np  # keep the zero-copy QImage backing alive
+        label._scale_key = key
+        label._scaled_pm = pm
         label.setPixmap(pm)
 
     # ========================================================================
@@ -865,15 +1797,18 @@ class VideoComparatorApp(QMainWindow):
             delta = -self.zoom_delta
         old_zoom = self.zoom
         self.zoom = max(0.1, min(8.0, self.zoom + delta))
-        logger.debug(f"Zoom: {old_zoom:.2f} → {self.zoom:.2f}")
-        self.on_frame_changed(self.frame_slider.value())
+        self._view_plan = None
+        logger.debug("Zoom: %.2f → %.2f", old_zoom, self.zoom)
+        self._schedule_render()
 
     def on_pan_requested(self, dx: int, dy: int):
         """Handle pan request (from mouse drag or keyboard)."""
         self.pan_x += dx
         self.pan_y += dy
-        logger.debug(f"Pan request: dx={dx}, dy={dy} → pan_x={self.pan_x}, pan_y={self.pan_y}")
-        self.on_frame_changed(self.frame_slider.value())
+        self._view_plan = None
+        logger.debug("Pan request: dx=%d, dy=%d → pan_x=%d, pan_y=%d",
+                     dx, dy, self.pan_x, self.pan_y)
+        self._schedule_render()
 
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts."""
@@ -899,6 +1834,20 @@ class VideoComparatorApp(QMainWindow):
         else:
             super().keyPressEvent(event)
 
+    def closeEvent(self, event):
+        """Shut down worker pools and release the frame buffers on exit.
+
+        __del__ at interpreter teardown is unreliable; without this the
+        shared-memory segments outlive the window until the resource
+        tracker (or a reboot) reaps them.
+        """
+        self.playback_timer.stop()
+        self._prefetch.clear()
+        self._prefetch_pool.shutdown(wait=True)
+        self._xform_pool.shutdown(wait=True)
+        self.comparator.close()
+        super().closeEvent(event)
+
     # ========================================================================
     # ROTATION
     # ========================================================================
@@ -907,7 +1856,10 @@ class VideoComparatorApp(QMainWindow):
         """Reset pan to (0,0) and refresh display."""
         self.pan_x = 0
         self.pan_y = 0
-        self.on_frame_changed(self.frame_slider.value())
+        self._rot_cache.clear()
+        self._view_plan = None
+        self._prefetch.clear()
+        self._schedule_render()
 
     def rotate_left(self):
         """Rotate images -90 degrees."""
@@ -944,18 +1896,38 @@ class VideoComparatorApp(QMainWindow):
 
         self.pan_x = 0
         self.pan_y = 0
+        self._view_plan = None
         logger.info(f"Fit to screen: zoom={self.zoom}")
-        self.on_frame_changed(self.frame_slider.value())
+        self._schedule_render()
 
     # ========================================================================
     # PIXEL INFO (HOVER-BASED)
     # ========================================================================
 
     def on_pixel_hovered(self, x: int, y: int):
-        """Display RGB values at hovered pixel (real-time)."""
+        """Record the hovered pixel; the label updates at most ~60 Hz.
+
+        Qt delivers a mouse-move per input event, far above the rate at
+        which the text is readable; only the latest position matters, so
+        bursts collapse into one timer shot instead of flooding the event
+        loop alongside playback.
+        """
+        self._pending_hover = (x, y)
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
+
+    def _show_hover_info(self):
+        """Render the pixel-info label for the most recent hover position."""
+        if self._pending_hover is None:
+            return
+        x, y = self._pending_hover
+        key = (x, y, self.comparator.current_frame_idx)
+        if key == self._last_hover_key:
+            return  # same pixel on the same frame: text already correct
         info = self.comparator.get_pixel_info(x, y)
         if not info:
             return
+        self._last_hover_key = key
         r1, g1, b1 = info["img1"]
         r2, g2, b2 = info["img2"]
         txt = (
@@ -1001,25 +1973,40 @@ class VideoComparatorApp(QMainWindow):
             logger.info("Loop disabled")
 
     def update_playback_timer(self):
-        """Update timer interval based on playback speed."""
-        speed = self.speed_spinbox.value()
-        interval = int(33 / speed)  # Base interval: 33ms (30fps)
-        interval = max(2, interval)  # At least 2ms for responsiveness
-        self.playback_timer.setInterval(interval)
+        """(Re)base the wall-clock playback schedule.
+
+        The timer fires at a constant short interval and advance_frame
+        derives the frame index from elapsed monotonic time, so timer
+        jitter and slow renders don't accumulate drift — when behind we
+        skip frames instead of stuttering. Rebasing here means a speed
+        change takes effect from the current frame onward.
+        """
+        self._play_t0 = time.perf_counter()
+        self._play_start_frame = self.frame_slider.value()
+        self._sched_frame = self._play_start_frame
+        self.playback_timer.setInterval(5)
 
         # Prevent timer coalescing - ensure every timeout fires
         self.playback_timer.setTimerType(Qt.TimerType.PreciseTimer)
 
     def advance_frame(self):
-        """Advance to next frame during playback."""
+        """Advance playback to the frame the wall-clock schedule calls for."""
         start = time.perf_counter()
         current = self.frame_slider.value()
         total = self.comparator.frame_count()
-        next_frame = current + 1
 
-        if next_frame >= total:
+        # 30 fps nominal rate, scaled by the speed control
+        elapsed = start - self._play_t0
+        target = self._play_start_frame + int(elapsed * 30 * self.speed_spinbox.value())
+        if target == current:
+            return  # timer fired early; the current frame is still due
+
+        if target >= total:
             if self.loop_enabled:
-                next_frame = 0
+                # Restart the schedule from frame 0
+                self._play_t0 = start
+                self._play_start_frame = 0
+                target = 0
             else:
                 self.is_playing = False
                 self.play_btn.setText("▶ Play")
@@ -1027,10 +2014,20 @@ class VideoComparatorApp(QMainWindow):
                 logger.info("Playback finished (no loop)")
                 return
 
-        self.frame_slider.setValue(next_frame)
+        # If the read-ahead worker prepared this frame, wait for it: the
+        # triplet is then a cache hit in on_frame_changed instead of a
+        # recompute on the GUI thread
+        fut = self._prefetch.pop(target, None)
+        if fut is not None:
+            fut.result()
+
+        self._sched_frame = target
+        self.frame_slider.setValue(target)
 
-        elapsed = time.perf_counter() - start
-        logger.debug(f"advance_frame took: {elapsed * 1000:.1f} ms")
+        if logger.isEnabledFor(logging.DEBUG):
+            # Skips the second perf_counter() read too, not just formatting
+            logger.debug("advance_frame took: %.1f ms",
+                         (time.perf_counter() - start) * 1000)
 
     # ========================================================================
     # SWAP LEFT/RIGHT
@@ -1042,6 +2039,8 @@ class VideoComparatorApp(QMainWindow):
             self.comparator.comp_frames, self.comparator.ref_frames
         self.comparator.ref_info, self.comparator.comp_info = \
             self.comparator.comp_info, self.comparator.ref_info
+        # Cached triplets hold (ref, comp, diff) in the old order
+        self.comparator._diff_cache.clear()
         self.ref_path, self.comp_path = self.comp_path, self.ref_path
         self.ref_label.setText(f"Ref: {self.ref_path or 'None'}")
         self.comp_label.setText(f"Comp: {self.comp_path or 'None'}")